@@ -1,5 +1,12 @@
+from .admission import *
 from .broker import *
+from .cache import *
+from .coalesce import *
 from .consumer import *
 from .emitter import *
 
-__all__ = ('Broker', "BrokerFactory", "BrokerManager", 'Consumer', 'Emitter')
+__all__ = (
+    'Broker', "BrokerFactory", "BrokerManager", "DormantBroker", 'Consumer', 'Emitter',
+    'AdmissionController', 'AdmissionRejected', 'Priority', 'Rejection',
+    'Reducer', 'LAST_WINS', 'LIST', 'ResultCache'
+)
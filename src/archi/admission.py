@@ -0,0 +1,183 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+class AdmissionRejected(RuntimeError):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+# Returned instead of True/False when a session could not be admitted.
+# It is falsy so `if await emitter.emit(): ...` keeps working.
+class Rejection:
+    __slots__ = ("reason",)
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"Rejection({self.reason!r})"
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive.")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self._last = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def available(self) -> bool:
+        self._refill()
+        return self.tokens >= 1.0
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1.0
+
+    def time_until_available(self) -> float:
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+class AdmissionController:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = 1.0,
+        max_queue: Optional[int] = None,
+        max_concurrent: Optional[int] = None
+    ):
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.max_queue = max_queue
+        self.max_concurrent = max_concurrent
+
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._queued = 0
+        self._active = 0
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        # Metrics
+        self.admitted = 0
+        self.rejected = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+        self.last_queue_delay = 0.0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def average_queue_delay(self) -> float:
+        return self.total_queue_delay / self.admitted if self.admitted else 0.0
+
+    def _can_admit(self) -> bool:
+        if self.max_concurrent is not None and self._active >= self.max_concurrent:
+            return False
+        return self.bucket is None or self.bucket.available()
+
+    def _admit(self):
+        self._active += 1
+        if self.bucket is not None:
+            self.bucket.take()
+
+    def _record(self, delay: float):
+        self.admitted += 1
+        self.total_queue_delay += delay
+        self.last_queue_delay = delay
+        self.max_queue_delay = max(self.max_queue_delay, delay)
+
+    def _dispatch(self):
+        self._wakeup = None
+        while self._waiters:
+            fut = self._waiters[0][2]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_admit():
+                break
+            heapq.heappop(self._waiters)
+            self._queued -= 1
+            self._admit()
+            fut.set_result(None)
+
+        # Only the token bucket needs a timer; concurrency slots are freed by release()
+        if self._queued and self._wakeup is None and self.bucket is not None and not self.bucket.available():
+            loop = asyncio.get_running_loop()
+            self._wakeup = loop.call_later(self.bucket.time_until_available(), self._dispatch)
+
+    def _shed_for(self, priority: int) -> bool:
+        # Drop the lowest-priority waiter if the newcomer outranks it
+        pending = [w for w in self._waiters if not w[2].done()]
+        if not pending:
+            return False
+        worst = max(pending)
+        if worst[0] <= priority:
+            return False
+        worst[2].set_exception(AdmissionRejected("shed by higher priority session"))
+        self._queued -= 1
+        self.rejected += 1
+        return True
+
+    async def acquire(self, priority: int = Priority.NORMAL) -> float:
+        start = time.monotonic()
+
+        if not self._queued and self._can_admit():
+            self._admit()
+            self._record(0.0)
+            return 0.0
+
+        if self.max_queue is not None and self._queued >= self.max_queue and not self._shed_for(priority):
+            self.rejected += 1
+            raise AdmissionRejected("admission queue is full")
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), fut))
+        self._queued += 1
+        self._dispatch()
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # Admitted right before being cancelled: give the slot back
+                self.release()
+            elif not fut.done() or fut.cancelled():
+                self._queued -= 1
+                self._dispatch()
+            raise
+
+        delay = time.monotonic() - start
+        self._record(delay)
+        return delay
+
+    def release(self):
+        if self._active > 0:
+            self._active -= 1
+        self._dispatch()
+
+__all__ = ("AdmissionController", "AdmissionRejected", "Priority", "Rejection", "TokenBucket")
@@ -1,11 +1,17 @@
 import asyncio
 import logging
+import sys
+import time
+from collections import OrderedDict
 from typing import Optional, Callable, Dict, Any
 from uuid6 import uuid7
 
+from .admission import AdmissionController, AdmissionRejected, Priority, Rejection
+from .coalesce import Batch, LAST_WINS
 from .emitter import Emitter, EmitterFactory
 from .consumer import Consumer
 from .event import EventBus
+from .sizing import deep_sizeof
 
 logger = logging.getLogger(__name__)
 
@@ -15,52 +21,299 @@ class BrokerFactory:
         uuid: Optional[str] = None,
         timeout: float = 1.0,
         event_bus: Optional[EventBus] = None,
-        emitter_factory: Optional[EmitterFactory] = None
+        emitter_factory: Optional[EmitterFactory] = None,
+        admission: Optional[AdmissionController] = None
     ) -> "Broker":
         return Broker(
             uuid=uuid or str(uuid7()),
             timeout=timeout,
             event_bus=event_bus or EventBus(),
-            emitter_factory=emitter_factory or EmitterFactory()
+            emitter_factory=emitter_factory or EmitterFactory(),
+            admission=admission
         )
 
+# Lightweight stand-in for a broker that is not materialized yet (or was evicted).
+# Only keeps what is needed to rebuild the full Broker on first use.
+class DormantBroker:
+    __slots__ = ("uuid", "timeout", "emitters", "consumers", "admission", "event_bus", "emitter_factory", "manager")
+
+    def __init__(
+        self,
+        uuid: str,
+        timeout: float = 1.0,
+        emitters: Optional[list[Emitter]] = None,
+        consumers: Optional[list[Consumer]] = None,
+        admission: Optional[AdmissionController] = None,
+        event_bus: Optional[EventBus] = None,
+        emitter_factory: Optional[EmitterFactory] = None,
+        manager: Optional["BrokerManager"] = None
+    ):
+        self.uuid = uuid
+        self.timeout = timeout
+        self.emitters = emitters or []
+        self.consumers = consumers or []
+        self.admission = admission
+        # Kept from an evicted broker so its subscribers and factory survive the round trip
+        self.event_bus = event_bus
+        self.emitter_factory = emitter_factory
+        self.manager = manager
+
+    def materialize(self) -> "Broker":
+        broker = BrokerFactory.create_broker(
+            uuid=self.uuid,
+            timeout=self.timeout,
+            event_bus=self.event_bus,
+            emitter_factory=self.emitter_factory,
+            admission=self.admission
+        )
+        for emitter in self.emitters:
+            if emitter.broker is self:
+                emitter.broker = None
+            broker.register_emitter(emitter)
+        for consumer in self.consumers:
+            if self.event_bus is not None:
+                # The kept bus is already subscribed
+                broker.consumers[consumer.uuid] = consumer
+            else:
+                broker.register_consumer(consumer)
+        return broker
+
+    def wake(self) -> Optional["Broker"]:
+        # Called by emitters still attached to this descriptor
+        if self.manager is not None:
+            return self.manager.get_broker(self.uuid)
+        return self.materialize()
+
+    @classmethod
+    def from_broker(cls, broker: "Broker", manager: Optional["BrokerManager"] = None) -> "DormantBroker":
+        return cls(
+            uuid=broker.uuid,
+            timeout=broker.timeout,
+            emitters=broker.get_all_emitters(),
+            consumers=list(broker.consumers.values()),
+            admission=broker.admission,
+            event_bus=broker.event_bus,
+            emitter_factory=broker.emitter_factory,
+            manager=manager
+        )
+
+# Bytes retained by a materialized broker: its containers, emitters, consumers,
+# subscribers and the payloads/results they hold. Shared objects (admission
+# controllers, result caches, callbacks) are not charged to the broker.
+# Payloads holding external resources need a custom `size_estimator`.
+def estimate_broker_size(broker: "Broker") -> int:
+    seen = {id(broker)}
+    size = sys.getsizeof(broker) + sys.getsizeof(broker.__dict__)
+
+    for container in (broker.emitters, broker.consumers, broker._emitter_tasks):
+        size += sys.getsizeof(container)
+    size += deep_sizeof(broker.emitted, seen)
+    size += deep_sizeof(broker._payload, seen)
+    size += deep_sizeof(broker._contributions, seen)
+
+    subscribers = broker.event_bus._subscribers
+    size += sys.getsizeof(broker.event_bus) + sys.getsizeof(subscribers)
+    size += sum(sys.getsizeof(handlers) for handlers in subscribers.values())
+
+    for emitter in broker.emitters.values():
+        size += sys.getsizeof(emitter) + sys.getsizeof(emitter.__dict__)
+        size += deep_sizeof(emitter._pending_payloads, seen)
+    for consumer in broker.consumers.values():
+        size += sys.getsizeof(consumer) + sys.getsizeof(consumer.__dict__)
+        size += deep_sizeof(consumer.payload, seen)
+        size += deep_sizeof(consumer.result, seen)
+
+    return size
+
 class BrokerManager:
-    def __init__(self):
-        self._brokers: Dict[str, Broker] = {}
+    def __init__(
+        self,
+        max_brokers: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        memory_budget: Optional[int] = None,
+        size_estimator: Callable[["Broker"], int] = estimate_broker_size,
+        admission: Optional[AdmissionController] = None
+    ):
+        # Materialized brokers, least recently active first. Brokers report their
+        # sessions through `activity_hook`, so this order matches `last_active`.
+        self._brokers: "OrderedDict[str, Broker]" = OrderedDict()
+        self._dormant: Dict[str, DormantBroker] = {}
+        self._eviction_hooks: list[Callable[["Broker"], None]] = []
 
-    def create_broker(self, uuid: Optional[str] = None, timeout: float = 1.0):
-        if uuid in self._brokers:
-            return self.get_broker(uuid)
+        self.max_brokers = max_brokers
+        self.idle_ttl = idle_ttl
+        self.memory_budget = memory_budget
+        self.size_estimator = size_estimator
+        # Running size of materialized brokers, only tracked with a memory budget
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        # Global admission control shared by every broker of this manager
+        self.admission = admission
 
-        broker = BrokerFactory.create_broker(uuid=uuid, timeout=timeout)
+    @property
+    def memory_usage(self) -> int:
+        return self._bytes
 
+    def _add(self, broker: "Broker"):
+        broker.global_admission = self.admission
+        broker.activity_hook = self._touch
+        broker.last_active = time.monotonic()
         self._brokers[broker.uuid] = broker
+        self._measure(broker)
+
+    def _discard(self, uuid: str) -> Optional["Broker"]:
+        broker = self._brokers.pop(uuid, None)
+        if broker is not None:
+            broker.activity_hook = None
+            self._bytes -= self._sizes.pop(uuid, 0)
+        return broker
+
+    def _measure(self, broker: "Broker"):
+        if self.memory_budget is None:
+            return
+        size = self.size_estimator(broker)
+        self._bytes += size - self._sizes.get(broker.uuid, 0)
+        self._sizes[broker.uuid] = size
+
+    def _touch(self, broker: "Broker"):
+        if self._brokers.get(broker.uuid) is not broker:
+            return
+        self._brokers.move_to_end(broker.uuid)
+        broker.last_active = time.monotonic()
+        self._measure(broker)
+
+    def create_broker(self, uuid: Optional[str] = None, timeout: float = 1.0, admission: Optional[AdmissionController] = None):
+        if uuid is not None and self.has_broker(uuid):
+            return self.get_broker(uuid)
+
+        broker = BrokerFactory.create_broker(uuid=uuid, timeout=timeout, admission=admission)
+
+        self._add(broker)
         logger.info(f"[BrokerManager] Created and added broker with UUID: {broker.uuid}")
+        self.evict_idle(keep=broker.uuid)
         return broker
 
+    def create_dormant_broker(self, uuid: Optional[str] = None, timeout: float = 1.0, admission: Optional[AdmissionController] = None) -> DormantBroker:
+        if uuid is not None and uuid in self._dormant:
+            return self._dormant[uuid]
+        if uuid is not None and uuid in self._brokers:
+            raise ValueError(f"Broker with UUID {uuid} is already materialized.")
+
+        descriptor = DormantBroker(uuid=uuid or str(uuid7()), timeout=timeout, admission=admission, manager=self)
+        self._dormant[descriptor.uuid] = descriptor
+        logger.info(f"[BrokerManager] Added dormant broker with UUID: {descriptor.uuid}")
+        return descriptor
+
     def register_broker(self, broker: "Broker"):
         # Tạo broker qua factory
-        if broker.uuid in self._brokers:
+        if self.has_broker(broker.uuid):
             raise ValueError(f"Broker with UUID {broker.uuid} already exists.")
 
-        self._brokers[broker.uuid] = broker
+        self._add(broker)
         logger.info(f"[BrokerManager] Created and added broker with UUID: {broker.uuid}")
+        self.evict_idle(keep=broker.uuid)
+
+    def register_eviction_hook(self, hook: Callable[["Broker"], None]):
+        self._eviction_hooks.append(hook)
+
+    def has_broker(self, uuid: str) -> bool:
+        return uuid in self._brokers or uuid in self._dormant
+
+    def is_dormant(self, uuid: str) -> bool:
+        return uuid in self._dormant
 
     def get_broker(self, uuid: str) -> Optional["Broker"]:
-        return self._brokers.get(uuid)
+        broker = self._brokers.get(uuid)
+        if broker is not None:
+            self._touch(broker)
+            return broker
+
+        descriptor = self._dormant.pop(uuid, None)
+        if descriptor is None:
+            return None
+
+        broker = descriptor.materialize()
+        self._add(broker)
+        logger.info(f"[BrokerManager] Materialized broker with UUID: {uuid}")
+        self.evict_idle(keep=uuid)
+        return broker
 
     def remove_broker(self, uuid: str) -> bool:
-        if uuid in self._brokers:
-            del self._brokers[uuid]
+        if uuid in self._brokers or uuid in self._dormant:
+            self._discard(uuid)
+            self._dormant.pop(uuid, None)
             logger.info(f"[BrokerManager] Removed broker with UUID: {uuid}")
             return True
         return False
 
+    def evict_broker(self, uuid: str) -> bool:
+        # Demote an idle broker back to a dormant descriptor; busy brokers are skipped
+        broker = self._brokers.get(uuid)
+        if broker is None or broker.is_busy():
+            return False
+
+        for hook in self._eviction_hooks:
+            try:
+                hook(broker)
+            except Exception as e:
+                logger.error(f"[BrokerManager] Eviction hook failed for broker {uuid}: {e}")
+
+        self._discard(uuid)
+        descriptor = DormantBroker.from_broker(broker, manager=self)
+        self._dormant[uuid] = descriptor
+        # Emitters point at the descriptor, so their next emit wakes the broker up
+        for emitter in broker.get_all_emitters():
+            emitter.broker = descriptor  # type: ignore
+        logger.info(f"[BrokerManager] Evicted broker with UUID: {uuid}")
+        return True
+
+    def evict_idle(self, keep: Optional[str] = None) -> int:
+        # Apply TTL, then count, then memory budget. Candidates are taken from the
+        # least recently active end and each pass stops as soon as it has enough,
+        # so the cost depends on the number of evictions, not on the number of brokers.
+        # `keep` is the broker about to be handed back to the caller.
+        evicted = 0
+
+        if self.idle_ttl is not None:
+            deadline = time.monotonic() - self.idle_ttl
+            victims = []
+            for uuid, broker in self._brokers.items():
+                if broker.last_active > deadline:
+                    break
+                if uuid != keep:
+                    victims.append(uuid)
+            evicted += sum(self.evict_broker(uuid) for uuid in victims)
+
+        if self.max_brokers is not None and len(self._brokers) > self.max_brokers:
+            excess = len(self._brokers) - self.max_brokers
+            victims = []
+            for uuid, broker in self._brokers.items():
+                if len(victims) >= excess:
+                    break
+                if uuid != keep and not broker.is_busy():
+                    victims.append(uuid)
+            evicted += sum(self.evict_broker(uuid) for uuid in victims)
+
+        if self.memory_budget is not None and self._bytes > self.memory_budget:
+            excess = self._bytes - self.memory_budget
+            victims = []
+            freed = 0
+            for uuid, broker in self._brokers.items():
+                if freed >= excess:
+                    break
+                if uuid != keep and not broker.is_busy():
+                    victims.append(uuid)
+                    freed += self._sizes.get(uuid, 0)
+            evicted += sum(self.evict_broker(uuid) for uuid in victims)
+
+        return evicted
+
     def register_emitter_to(self, broker_uuid: str, emitter: Emitter):
         broker = self.get_broker(broker_uuid)
         if not broker:
             raise ValueError(f"No broker found with UUID: {broker_uuid}")
         broker.register_emitter(emitter)
+        self._measure(broker)
         logger.info(f"[BrokerManager] Registered emitter {emitter.uuid} to broker {broker_uuid}")
 
     def register_consumer_to(self, broker_uuid: str, consumer: Consumer):
@@ -68,19 +321,30 @@ class BrokerManager:
         if not broker:
             raise ValueError(f"No broker found with UUID: {broker_uuid}")
         broker.register_consumer(consumer)
+        self._measure(broker)
         logger.info(f"[BrokerManager] Registered consumer {consumer.uuid} to broker {broker_uuid}")
 
     def update_broker_timeout(self, uuid: str, timeout: float):
-        broker = self.get_broker(uuid)
+        descriptor = self._dormant.get(uuid)
+        if descriptor:
+            descriptor.timeout = timeout
+            logger.info(f"[BrokerManager] Updated timeout for dormant broker {uuid} to {timeout}")
+            return
+
+        broker = self._brokers.get(uuid)
         if broker:
             broker.timeout = timeout
             logger.info(f"[BrokerManager] Updated timeout for broker {uuid} to {timeout}")
 
     def get_all_brokers(self) -> list["Broker"]:
+        # Only materialized brokers; dormant ones are not woken up here
         return list(self._brokers.values())
 
+    def get_all_dormant_brokers(self) -> list[DormantBroker]:
+        return list(self._dormant.values())
+
 class Broker:
-    def __init__(self, uuid: Optional[str] = None, timeout: float = 1.0, event_bus: Optional[EventBus] = None, emitter_factory: Optional[EmitterFactory] = None):
+    def __init__(self, uuid: Optional[str] = None, timeout: float = 1.0, event_bus: Optional[EventBus] = None, emitter_factory: Optional[EmitterFactory] = None, admission: Optional[AdmissionController] = None):
         self.uuid = uuid or str(uuid7())
         self.timeout = timeout
         self.emitters: dict[str, Emitter] = {}
@@ -88,11 +352,21 @@ class Broker:
         self.consumers: dict[str, Consumer] = {}
         self.event_bus = event_bus or EventBus()
         self.emitter_factory = emitter_factory or EmitterFactory()
+        self.admission = admission
+        self.global_admission: Optional[AdmissionController] = None
+        # Set by BrokerManager so session activity keeps its LRU order up to date
+        self.activity_hook: Optional[Callable[["Broker"], None]] = None
 
         self._payload = []
+        # Payloads of coalescing emitters, merged per emitter for the current session
+        self._contributions: dict[str, Any] = {}
         self._emitter_tasks: dict[str, asyncio.Task] = {}
         self._session_opened = False
         self._session_lock = asyncio.Lock()
+        self._pending_sessions = 0
+        # Settled with True once the queued session opens, or with its Rejection
+        self._session_ticket: Optional[asyncio.Future] = None
+        self.last_active = time.monotonic()
 
     def create_emitter(self, uuid: Optional[str] = None, resolve_callback: Optional[Callable[[], None]] = None) -> Emitter:
         emitter = self.emitter_factory.create_emitter(uuid, resolve_callback)
@@ -131,17 +405,100 @@ class Broker:
         except Exception as e:
             logger.error(f"[Broker] Error awaiting emitter {emitter.uuid}: {e}")
 
+    def contribute(self, emitter: Emitter, payload: Any) -> bool:
+        # Returns True when the emitter already contributed to this session (a duplicate emit)
+        reducer = emitter.reducer or LAST_WINS
+        payloads = payload if isinstance(payload, Batch) else [payload]
+        duplicate = emitter.uuid in self._contributions
+
+        for item in payloads:
+            if emitter.uuid in self._contributions:
+                self._contributions[emitter.uuid] = reducer.merge(self._contributions[emitter.uuid], item)
+            else:
+                self._contributions[emitter.uuid] = reducer.initial(item)
+        return duplicate
+
+    def is_busy(self) -> bool:
+        return self._session_opened or self._session_lock.locked() or self._pending_sessions > 0
+
+    async def _admit(self, priority: int) -> list[AdmissionController]:
+        admitted: list[AdmissionController] = []
+        try:
+            for controller in (self.admission, self.global_admission):
+                if controller is not None:
+                    await controller.acquire(priority)
+                    admitted.append(controller)
+        except BaseException:
+            for controller in admitted:
+                controller.release()
+            raise
+        return admitted
+
+    async def join_pending_session(self):
+        # Peers emitting while a session waits for admission wait for its outcome
+        ticket = self._session_ticket
+        if ticket is None:
+            return True
+        return await asyncio.shield(ticket)
+
+    def _settle_ticket(self, ticket: Optional[asyncio.Future], outcome: Any):
+        if ticket is not None and not ticket.done():
+            ticket.set_result(outcome)
+        if ticket is not None and self._session_ticket is ticket:
+            self._session_ticket = None
+
     async def collect_emit(self, uuid: str, payload: Any):
+        emitter = self.emitters.get(uuid)
+        priority = emitter.priority if emitter is not None else Priority.NORMAL
+
+        ticket = None
+        if self._session_ticket is None:
+            ticket = self._session_ticket = asyncio.get_running_loop().create_future()
+
+        self._pending_sessions += 1
+        try:
+            try:
+                admitted = await self._admit(priority)
+            except AdmissionRejected as e:
+                logger.warning(f"[Broker {self.uuid}] Session from emitter {uuid} rejected: {e.reason}")
+                rejection = Rejection(e.reason)
+                self._settle_ticket(ticket, rejection)
+                return rejection
+
+            try:
+                return await self._run_session(uuid, payload, ticket)
+            finally:
+                for controller in admitted:
+                    controller.release()
+        finally:
+            self._pending_sessions -= 1
+            # No-op unless the session ended before it opened (e.g. cancelled)
+            self._settle_ticket(ticket, Rejection("session was cancelled"))
+
+    def _mark_active(self):
+        self.last_active = time.monotonic()
+        if self.activity_hook is not None:
+            self.activity_hook(self)
+
+    async def _run_session(self, uuid: str, payload: Any, ticket: Optional[asyncio.Future] = None):
         async with self._session_lock:
+            self._mark_active()
             self._session_opened = True
+            self._settle_ticket(ticket, True)
             self.emitted.add(uuid)
-            self._payload.append(payload)
+            emitter = self.emitters.get(uuid)
+            if emitter is not None and emitter.reducer is not None:
+                self.contribute(emitter, payload)
+            else:
+                self._payload.append(payload)
 
             pending = [e for k, e in self.emitters.items() if k not in self.emitted]
 
             try:
                 await asyncio.gather(*[e.await_resolution(timeout=self.timeout) for e in pending])
                 print("[Broker] All emitters resolved. Broadcasting to consumers...")
+                if self._contributions:
+                    self._payload.extend(self._contributions.values())
                 await self.event_bus.emit("all_resolved", self._payload)
                 return True
             except Exception as e:
@@ -150,5 +507,9 @@ class Broker:
             finally:
                 self._session_opened = False
                 self.emitted.clear()
+                # Consumers keep their reference; start the next session with a fresh list
+                self._payload = []
+                self._contributions = {}
+                self._mark_active()
 
-__all__ = ("Broker", "BrokerManager", "BrokerFactory")
+__all__ = ("Broker", "BrokerManager", "BrokerFactory", "DormantBroker")
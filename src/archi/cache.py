@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from .sizing import deep_sizeof
+
+def _encode(value: Any) -> bytes:
+    # Every value is tagged with its type and containers are length-prefixed, so
+    # 1 / "1", (1, 2) / [1, 2] and {1: ..} / {"1": ..} never share an encoding.
+    kind = type(value)
+    if value is None:
+        return b"N"
+    if kind is bool:
+        return b"T" if value else b"F"
+    if kind is int:
+        return b"i%d;" % value
+    if kind is float:
+        return b"f" + value.hex().encode() + b";"
+    if kind is str:
+        data = value.encode()
+        return b"s%d:" % len(data) + data
+    if kind is bytes:
+        return b"b%d:" % len(value) + value
+    if kind is list or kind is tuple:
+        tag = b"l" if kind is list else b"t"
+        return tag + b"%d:" % len(value) + b"".join(_encode(item) for item in value)
+    if kind is set or kind is frozenset:
+        tag = b"e" if kind is set else b"z"
+        return tag + b"%d:" % len(value) + b"".join(sorted(_encode(item) for item in value))
+    if kind is dict:
+        # Encoded keys start with their type tag, so this sorts by (type, key)
+        items = sorted((_encode(k), _encode(v)) for k, v in value.items())
+        return b"d%d:" % len(items) + b"".join(k + v for k, v in items)
+    raise TypeError(f"Cannot hash payload value of type {kind.__qualname__}")
+
+def content_hash(payload: Any) -> str:
+    # Raises TypeError for values that have no stable encoding (never falls back to repr)
+    return hashlib.sha256(_encode(payload)).hexdigest()
+
+# Result cache keyed by payload content. Keys are namespaced per consumer, so one
+# cache (and one byte budget) can be shared by several consumers.
+class ResultCache:
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        key_func: Callable[[Any], str] = content_hash,
+        size_of: Callable[[Any], int] = deep_sizeof
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.key_func = key_func
+        self.size_of = size_of
+
+        # key -> (value, size, expires_at), least recently used first
+        self._entries: "OrderedDict[str, tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._bytes = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.shared + self.misses
+        return (self.hits + self.shared) / total if total else 0.0
+
+    def key_for(self, payload: Any, namespace: str = "") -> Optional[str]:
+        # None means the payload can't be keyed reliably and must not be cached
+        try:
+            digest = self.key_func(payload)
+        except TypeError:
+            self.skipped += 1
+            return None
+        return f"{namespace}:{digest}" if namespace else digest
+
+    def _lookup(self, key: str) -> Optional[tuple[Any, int, Optional[float]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] is not None and entry[2] <= time.monotonic():
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _store(self, key: str, value: Any):
+        size = self.size_of(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._lookup(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        # Single flight: identical concurrent sessions wait for the first computation
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.shared += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        # The computation runs on its own task, so a cancelled caller doesn't cancel the others
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._store(key, task.result())
+
+__all__ = ("ResultCache", "content_hash")
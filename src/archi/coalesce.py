@@ -0,0 +1,25 @@
+from typing import Any, Callable, Optional, Union
+
+class Reducer:
+    def __init__(self, merge: Callable[[Any, Any], Any], initial: Optional[Callable[[Any], Any]] = None):
+        self.merge = merge
+        self.initial = initial or (lambda payload: payload)
+
+def _append(merged: list[Any], payload: Any) -> list[Any]:
+    merged.append(payload)
+    return merged
+
+# Payloads buffered by a debounced emitter, folded one by one by the broker
+class Batch(list):
+    pass
+
+LAST_WINS = Reducer(lambda merged, payload: payload)
+LIST = Reducer(_append, initial=lambda payload: [payload])
+
+# Plain callables are treated as a merge function with the first payload as initial value
+def as_reducer(reducer: Union[Reducer, Callable[[Any, Any], Any], None]) -> Optional[Reducer]:
+    if reducer is None or isinstance(reducer, Reducer):
+        return reducer
+    return Reducer(reducer)
+
+__all__ = ("Batch", "Reducer", "LAST_WINS", "LIST", "as_reducer")
@@ -4,29 +4,41 @@ import asyncio
 from typing import Optional, Callable, TYPE_CHECKING, Any, List
 from uuid import uuid4
 
+from .cache import ResultCache
+
 if TYPE_CHECKING:
     from src.archi.broker import Broker
 
 logger = logging.getLogger(__name__)
 
 class Consumer:
-    def __init__(self, uuid: Optional[str] = None, callback: Optional[Callable[[List[Any]], bool]] = None):
+    def __init__(self, uuid: Optional[str] = None, callback: Optional[Callable[[List[Any]], bool]] = None, cache: Optional[ResultCache] = None):
         self.uuid = uuid or str(uuid4())
         self.broker: Broker | None = None
         self.callback = callback
         self.payload = None
+        self.result = None
+        # Opt-in: skip the callback when an identical payload was already consumed
+        self.cache = cache
+
+    async def _run_callback(self, payload: List[Any]):
+        if asyncio.iscoroutinefunction(self.callback):
+            return await self.callback(payload)
+
+        async def wrapper(func):
+            return func(payload)
+
+        return await wrapper(self.callback)
 
     async def consume(self, payload: List[Any]):
         self.payload = payload
         if self.callback is not None:
-            if asyncio.iscoroutinefunction(self.callback):
-                if self.callback is not None:
-                    await self.callback(payload)
+            # Namespaced by consumer so a shared cache never returns another callback's result
+            key = self.cache.key_for(payload, namespace=self.uuid) if self.cache is not None else None
+            if key is not None:
+                self.result = await self.cache.get_or_compute(key, lambda: self._run_callback(payload))  # type: ignore
             else:
-                async def wrapper(func):
-                    func(payload)
-                
-                await wrapper(self.callback)
+                self.result = await self._run_callback(payload)
 
         logger.info(f"[Consumer {self.uuid}] Consumed...")
 
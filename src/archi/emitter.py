@@ -1,8 +1,11 @@
 import asyncio
 import logging
-from typing import Optional, Callable, TYPE_CHECKING, Any
+from typing import Optional, Callable, TYPE_CHECKING, Any, Union
 from uuid6 import uuid7
 
+from .admission import Priority
+from .coalesce import Batch, Reducer, as_reducer
+
 if TYPE_CHECKING:
     from broker import Broker
 
@@ -10,25 +13,111 @@ logger = logging.getLogger(__name__)
 
 class EmitterFactory:
     @staticmethod
-    def create_emitter(uuid: Optional[str] = None, resolve_callback: Optional[Callable[[], None]] = None) -> "Emitter":
-        emitter = Emitter(uuid)
+    def create_emitter(
+        uuid: Optional[str] = None,
+        resolve_callback: Optional[Callable[[], None]] = None,
+        priority: int = Priority.NORMAL,
+        reducer: Union[Reducer, Callable[[Any, Any], Any], None] = None,
+        debounce: Optional[float] = None
+    ) -> "Emitter":
+        emitter = Emitter(uuid, priority=priority, reducer=reducer, debounce=debounce)
         emitter.resolve_callback = resolve_callback
         return emitter
 
 class Emitter:
-    def __init__(self, uuid: Optional[str] = None):
+    def __init__(
+        self,
+        uuid: Optional[str] = None,
+        priority: int = Priority.NORMAL,
+        reducer: Union[Reducer, Callable[[Any, Any], Any], None] = None,
+        debounce: Optional[float] = None
+    ):
         self.uuid = uuid or str(uuid7())
+        # Sessions started by higher-priority emitters are admitted first
+        self.priority = priority
         self.broker: Broker | None = None
         self._resolved = asyncio.Event()
         self.resolve_callback: Optional[Callable[[], None]] = None
 
+        # Coalescing: repeated emits within a session (or a debounce window) are merged
+        self.reducer = as_reducer(reducer)
+        self.debounce = debounce
+        self.coalesced = 0
+        self._pending: Optional[asyncio.Future] = None
+        self._pending_payloads: list[Any] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _wake_broker(self):
+        from .broker import DormantBroker
+
+        # The broker was evicted by its manager: materialize it again
+        if isinstance(self.broker, DormantBroker):
+            self.broker = self.broker.wake()
+
     async def emit(self, payload: Optional[Any] = None):
+        self._wake_broker()
         if not self.broker:
             raise RuntimeError("Emitter has no broker.")
 
+        if self.debounce:
+            return await self._debounced_emit(payload)
+        return await self._emit(payload)
+
+    async def _debounced_emit(self, payload: Any):
+        self._pending_payloads.append(payload)
+
+        if self._pending is None:
+            pending = asyncio.get_running_loop().create_future()
+            # Avoid "exception never retrieved" when every caller went away
+            pending.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending = pending
+            # The flush runs on its own task so cancelling one caller doesn't drop the window
+            self._flush_task = asyncio.create_task(self._flush(pending))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(self._pending)
+
+    async def _flush(self, pending: asyncio.Future):
         try:
+            await asyncio.sleep(self.debounce)  # type: ignore
+            payloads = self._pending_payloads
+            self._pending = None
+            self._pending_payloads = []
+
+            # Without a reducer the last payload wins; otherwise the broker folds the batch
+            payload = Batch(payloads) if self.reducer is not None else payloads[-1]
+            result = await self._emit(payload)
+        except BaseException as e:
+            if self._pending is pending:
+                self._pending = None
+                self._pending_payloads = []
+            if not pending.done():
+                if isinstance(e, asyncio.CancelledError):
+                    pending.set_exception(RuntimeError(f"Emitter {self.uuid} debounced emit was cancelled"))
+                else:
+                    pending.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+
+        pending.set_result(result)
+
+    async def _emit(self, payload: Any):
+        self._wake_broker()
+        if not self.broker:
+            raise RuntimeError("Emitter has no broker.")
+
+        try:
+            # A session still waiting for admission: wait until it opens, then join it.
+            # If it is shed or rejected, report the same Rejection.
+            if not self.broker._session_opened and self.broker._pending_sessions:
+                outcome = await self.broker.join_pending_session()
+                if not outcome:
+                    return outcome
+
             # First emitter: begin coordination
-            if not self.broker._session_opened:
+            if not (self.broker._session_opened or self.broker._pending_sessions):
                 logger.info(f"[Emitter {self.uuid}] emitting (starting session)...")
 
                 if self.broker is None:
@@ -41,6 +130,11 @@ class Emitter:
 
                 return result
             else:
+                # Repeated emit from this emitter in the same session: merge, don't resolve again
+                if self.reducer is not None and self.broker.contribute(self, payload):
+                    self.coalesced += 1
+                    return True
+
                 # Called during a session — resolve immediately
                 async def wrapper():
                     self._resolve()
@@ -0,0 +1,40 @@
+import sys
+import types
+from typing import Any, Optional
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+# Bytes retained by `value`: follows builtin containers and plain instance attributes.
+# Classes, modules and functions are counted shallowly. Objects listed in `seen` are skipped,
+# which lets callers avoid charging shared objects twice.
+def deep_sizeof(value: Any, seen: Optional[set[int]] = None) -> int:
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [value]
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, _ATOMIC) or isinstance(item, _OPAQUE):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            attrs = getattr(item, "__dict__", None)
+            if isinstance(attrs, dict):
+                stack.append(attrs)
+            for name in getattr(type(item), "__slots__", ()):
+                if hasattr(item, name):
+                    stack.append(getattr(item, name))
+
+    return size
+
+__all__ = ("deep_sizeof",)
@@ -0,0 +1,155 @@
+import pytest
+import asyncio
+from src.archi.admission import AdmissionController, AdmissionRejected, Priority, Rejection, TokenBucket
+from src.archi.broker import Broker, BrokerManager
+from src.archi.consumer import Consumer
+from src.archi.emitter import Emitter
+
+def test_token_bucket_limits_burst():
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    bucket.take()
+    bucket.take()
+    assert not bucket.available()
+    assert bucket.time_until_available() > 0
+
+def test_rejection_is_falsy():
+    rejection = Rejection("full")
+    assert not rejection
+    assert rejection.reason == "full"
+
+@pytest.mark.asyncio
+async def test_acquire_is_immediate_when_tokens_available():
+    controller = AdmissionController(rate=100.0, burst=2)
+    assert await controller.acquire() == 0.0
+    assert controller.admitted == 1
+
+@pytest.mark.asyncio
+async def test_rate_limit_queues_and_records_delay():
+    controller = AdmissionController(rate=20.0)
+    await controller.acquire()
+    delay = await controller.acquire()
+    assert delay > 0
+    assert controller.max_queue_delay == delay
+    assert controller.average_queue_delay > 0
+
+@pytest.mark.asyncio
+async def test_high_priority_is_admitted_first():
+    controller = AdmissionController(max_concurrent=1)
+    await controller.acquire()
+    order = []
+
+    async def waiter(name, priority):
+        await controller.acquire(priority)
+        order.append(name)
+        controller.release()
+
+    tasks = [
+        asyncio.create_task(waiter("low", Priority.LOW)),
+        asyncio.create_task(waiter("normal", Priority.NORMAL)),
+        asyncio.create_task(waiter("high", Priority.HIGH)),
+    ]
+    await asyncio.sleep(0)
+    controller.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "normal", "low"]
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_and_sheds_lower_priority():
+    controller = AdmissionController(max_concurrent=1, max_queue=1)
+    await controller.acquire()
+
+    low = asyncio.create_task(controller.acquire(Priority.LOW))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected):
+        await controller.acquire(Priority.LOW)
+
+    high = asyncio.create_task(controller.acquire(Priority.HIGH))
+    await asyncio.sleep(0)
+    with pytest.raises(AdmissionRejected):
+        await low
+
+    controller.release()
+    await high
+    assert controller.rejected == 2
+
+@pytest.mark.asyncio
+async def test_broker_returns_rejection_when_queue_full():
+    broker = Broker(timeout=0.2, admission=AdmissionController(max_concurrent=1, max_queue=0))
+    emitter1 = Emitter("E1")
+    emitter2 = Emitter("E2")
+    broker.register_emitter(emitter1)
+    broker.register_emitter(emitter2)
+
+    first = asyncio.create_task(broker.collect_emit("E1", None))
+    await asyncio.sleep(0)
+    result = await broker.collect_emit("E2", None)
+    emitter2._resolve()
+    await first
+
+    assert isinstance(result, Rejection)
+    assert broker.admission.active == 0
+
+@pytest.mark.asyncio
+async def test_manager_global_admission_is_shared():
+    controller = AdmissionController(rate=1000.0, burst=10)
+    manager = BrokerManager(admission=controller)
+    broker = manager.create_broker(timeout=0.1)
+    emitter = Emitter()
+    broker.register_emitter(emitter)
+
+    assert await emitter.emit() is True
+    assert controller.admitted == 1
+    assert controller.active == 0
+
+@pytest.mark.asyncio
+async def test_peers_join_session_waiting_for_admission():
+    controller = AdmissionController(rate=5.0)
+    broker = Broker(timeout=0.5, admission=controller)
+    received = []
+    broker.register_consumer(Consumer(callback=lambda payload: received.append(list(payload))))
+    emitter1 = Emitter("E1")
+    emitter2 = Emitter("E2")
+    broker.register_emitter(emitter1)
+    broker.register_emitter(emitter2)
+
+    # Drain the bucket so the next session has to queue
+    await controller.acquire()
+    controller.release()
+
+    first = asyncio.create_task(emitter1.emit("first"))
+    await asyncio.sleep(0.01)
+    assert await emitter2.emit("second") is True
+
+    assert await first is True
+    assert received == [["first"]]
+    assert controller.admitted == 2
+
+@pytest.mark.asyncio
+async def test_peer_of_shed_session_gets_rejection():
+    controller = AdmissionController(max_concurrent=1, max_queue=1)
+    broker = Broker(timeout=0.5, admission=controller)
+    received = []
+    broker.register_consumer(Consumer(callback=lambda payload: received.append(list(payload))))
+    starter = Emitter("STARTER", priority=Priority.LOW)
+    peer = Emitter("PEER")
+    broker.register_emitter(starter)
+    broker.register_emitter(peer)
+
+    await controller.acquire()
+    first = asyncio.create_task(starter.emit("first"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(peer.emit("second"))
+    await asyncio.sleep(0)
+
+    high = asyncio.create_task(controller.acquire(Priority.HIGH))
+    await asyncio.sleep(0)
+
+    assert isinstance(await first, Rejection)
+    assert isinstance(await second, Rejection)
+    assert received == []
+
+    controller.release()
+    await high
+    controller.release()
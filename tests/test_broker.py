@@ -1,9 +1,11 @@
 import pytest
 import asyncio
 from unittest.mock import AsyncMock
-from src.archi.broker import Broker, BrokerManager, BrokerFactory
+from src.archi.broker import Broker, BrokerManager, BrokerFactory, estimate_broker_size
 from src.archi.emitter import Emitter
 from src.archi.consumer import Consumer
+from src.archi.emitter import EmitterFactory
+from src.archi.event import EventBus
 
 @pytest.mark.asyncio
 async def test_broker_single_session_and_emitters():
@@ -210,3 +212,154 @@ def test_get_all_brokers_returns_list():
     b2 = manager.create_broker()
     all_brokers = manager.get_all_brokers()
     assert b1 in all_brokers and b2 in all_brokers
+
+# -------- Eviction & lazy materialization Tests --------
+
+def test_dormant_broker_materializes_on_first_use():
+    manager = BrokerManager()
+    descriptor = manager.create_dormant_broker(uuid="tenant-1", timeout=2.0)
+
+    assert manager.is_dormant("tenant-1")
+    assert manager.get_all_brokers() == []
+
+    broker = manager.get_broker(descriptor.uuid)
+    assert isinstance(broker, Broker)
+    assert broker.timeout == 2.0
+    assert not manager.is_dormant("tenant-1")
+    assert manager.get_broker("tenant-1") is broker
+
+def test_max_brokers_evicts_least_recently_used():
+    manager = BrokerManager(max_brokers=2)
+    b1 = manager.create_broker(uuid="b1")
+    manager.create_broker(uuid="b2")
+    manager.get_broker("b1")
+    manager.create_broker(uuid="b3")
+
+    assert manager.is_dormant("b2")
+    assert b1 in manager.get_all_brokers()
+    assert len(manager.get_all_brokers()) == 2
+
+def test_idle_ttl_evicts_and_calls_hooks():
+    manager = BrokerManager(idle_ttl=0.0)
+    evicted = []
+    manager.register_eviction_hook(lambda b: evicted.append(b.uuid))
+    manager.create_broker(uuid="idle")
+    fresh = manager.create_broker(uuid="fresh")
+
+    assert evicted == ["idle"]
+    assert manager.is_dormant("idle")
+    assert manager.get_broker("fresh") is fresh
+
+def test_returned_broker_is_never_evicted():
+    manager = BrokerManager(idle_ttl=0.0)
+    broker = manager.create_broker(uuid="t")
+    assert not manager.is_dormant("t")
+    assert manager.get_broker("t") is broker
+
+def test_memory_budget_evicts_until_under_budget():
+    manager = BrokerManager(memory_budget=150, size_estimator=lambda b: 100)
+    manager.create_broker(uuid="b1")
+    manager.create_broker(uuid="b2")
+
+    assert manager.is_dormant("b1")
+    assert not manager.is_dormant("b2")
+
+def test_evicted_broker_restores_registrations():
+    manager = BrokerManager()
+    broker = manager.create_broker(uuid="b1")
+    emitter = Emitter("E1")
+    consumer = Consumer("C1")
+    broker.register_emitter(emitter)
+    broker.register_consumer(consumer)
+
+    assert manager.evict_broker("b1") is True
+    assert emitter.broker is not broker
+
+    restored = manager.get_broker("b1")
+    assert restored is not broker
+    assert emitter.broker is restored
+    assert "C1" in restored.consumers
+
+def test_busy_broker_is_not_evicted():
+    manager = BrokerManager()
+    broker = manager.create_broker(uuid="busy")
+    broker._session_opened = True
+    assert manager.evict_broker("busy") is False
+    assert manager.get_broker("busy") is broker
+
+def test_evicted_broker_keeps_custom_event_bus_and_factory():
+    manager = BrokerManager()
+    event_bus = EventBus()
+    emitter_factory = EmitterFactory()
+    broker = BrokerFactory.create_broker(uuid="custom", event_bus=event_bus, emitter_factory=emitter_factory)
+    manager.register_broker(broker)
+
+    handler = AsyncMock()
+    event_bus.subscribe("all_resolved", handler)
+    consumer = Consumer("C1")
+    broker.register_consumer(consumer)
+
+    manager.evict_broker("custom")
+    restored = manager.get_broker("custom")
+
+    assert restored.event_bus is event_bus
+    assert restored.emitter_factory is emitter_factory
+    assert event_bus._subscribers["all_resolved"] == [handler, consumer.consume]
+    assert "C1" in restored.consumers
+
+@pytest.mark.asyncio
+async def test_emit_wakes_evicted_broker():
+    manager = BrokerManager(max_brokers=1)
+    manager.create_broker(uuid="b1", timeout=0.1)
+    emitter = Emitter("E1")
+    manager.register_emitter_to("b1", emitter)
+    received = []
+    manager.register_consumer_to("b1", Consumer(callback=lambda payload: received.append(list(payload))))
+
+    manager.create_broker(uuid="b2")
+    assert manager.is_dormant("b1")
+
+    assert await emitter.emit("hello") is True
+    assert not manager.is_dormant("b1")
+    assert emitter.broker is manager.get_broker("b1")
+    assert received == [["hello"]]
+
+@pytest.mark.asyncio
+async def test_session_activity_updates_lru_order():
+    manager = BrokerManager(max_brokers=2)
+    b1 = manager.create_broker(uuid="b1", timeout=0.1)
+    manager.create_broker(uuid="b2")
+    emitter = Emitter("E1")
+    manager.register_emitter_to("b1", emitter)
+
+    manager.get_broker("b2")
+    await emitter.emit()
+    manager.create_broker(uuid="b3")
+
+    assert manager.is_dormant("b2")
+    assert manager.get_broker("b1") is b1
+
+def test_memory_budget_measures_each_broker_once():
+    calls = 0
+    def estimator(broker):
+        nonlocal calls
+        calls += 1
+        return 1
+
+    manager = BrokerManager(idle_ttl=3600, memory_budget=10_000, size_estimator=estimator)
+    for _ in range(200):
+        manager.create_broker()
+
+    assert calls == 200
+    assert manager.memory_usage == 200
+
+def test_estimate_broker_size_counts_retained_payloads():
+    broker = Broker()
+    consumer = Consumer()
+    broker.register_emitter(Emitter())
+    broker.register_consumer(consumer)
+    before = estimate_broker_size(broker)
+
+    consumer.payload = [{"blob": "x" * 100_000}]
+
+    assert estimate_broker_size(broker) - before >= 100_000
@@ -0,0 +1,139 @@
+import pytest
+import asyncio
+from src.archi.cache import ResultCache, content_hash
+
+def test_content_hash_is_stable_across_key_order():
+    assert content_hash([{"a": 1, "b": 2}]) == content_hash([{"b": 2, "a": 1}])
+    assert content_hash([1, 2]) != content_hash([2, 1])
+
+@pytest.mark.asyncio
+async def test_hit_and_miss_counters():
+    cache = ResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return "value"
+
+    assert await cache.get_or_compute("k", compute) == "value"
+    assert await cache.get_or_compute("k", compute) == "value"
+    assert calls == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+@pytest.mark.asyncio
+async def test_single_flight_computes_once():
+    cache = ResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    results = await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(5)])
+    assert results == [1] * 5
+    assert calls == 1
+    assert cache.shared == 4
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_without_caching():
+    cache = ResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_compute("k", compute),
+        cache.get_or_compute("k", compute),
+        return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert "k" not in cache
+
+@pytest.mark.asyncio
+async def test_lru_and_byte_budget_eviction():
+    cache = ResultCache(max_entries=2, max_bytes=25, size_of=lambda v: 10)
+
+    async def value():
+        return "v"
+
+    for key in ("a", "b"):
+        await cache.get_or_compute(key, value)
+    await cache.get_or_compute("a", value)
+    await cache.get_or_compute("c", value)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.bytes == 20
+    assert cache.evictions == 1
+
+@pytest.mark.asyncio
+async def test_ttl_expires_entries():
+    cache = ResultCache(ttl=0.01)
+
+    async def value():
+        return "v"
+
+    await cache.get_or_compute("k", value)
+    await asyncio.sleep(0.02)
+    assert "k" not in cache
+    assert len(cache) == 0
+
+def test_content_hash_distinguishes_types():
+    assert content_hash([{1: "a"}]) != content_hash([{"1": "a"}])
+    assert content_hash([(1, 2)]) != content_hash([[1, 2]])
+    assert content_hash([1]) != content_hash([1.0])
+    assert content_hash([True]) != content_hash([1])
+    assert content_hash({1, 2}) == content_hash({2, 1})
+    assert content_hash({1: "a", "1": "b"}) == content_hash({"1": "b", 1: "a"})
+
+def test_content_hash_rejects_arbitrary_objects():
+    class Obj:
+        def __init__(self, value):
+            self.value = value
+
+    with pytest.raises(TypeError):
+        content_hash([Obj(1)])
+
+@pytest.mark.asyncio
+async def test_unhashable_payload_is_not_cached():
+    cache = ResultCache()
+
+    class Obj:
+        pass
+
+    assert cache.key_for([Obj()]) is None
+    assert cache.skipped == 1
+    assert len(cache) == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_cancel_waiters():
+    cache = ResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+    assert first.cancelled()
+    assert "k" in cache
+
+@pytest.mark.asyncio
+async def test_byte_budget_counts_nested_results():
+    cache = ResultCache(max_bytes=10_000)
+
+    async def blob():
+        return {"blob": "x" * 100_000}
+
+    await cache.get_or_compute("k", blob)
+
+    assert len(cache) == 0
+    assert cache.bytes == 0
@@ -0,0 +1,62 @@
+import pytest
+from src.archi.consumer import Consumer
+from src.archi.cache import ResultCache
+
+@pytest.mark.asyncio
+async def test_consume_stores_callback_result():
+    consumer = Consumer(callback=lambda payload: len(payload))
+    await consumer.consume([1, 2, 3])
+    assert consumer.payload == [1, 2, 3]
+    assert consumer.result == 3
+
+@pytest.mark.asyncio
+async def test_consume_with_cache_skips_identical_payloads():
+    calls = 0
+
+    async def aggregate(payload):
+        nonlocal calls
+        calls += 1
+        return sum(payload)
+
+    cache = ResultCache()
+    consumer = Consumer(callback=aggregate, cache=cache)
+
+    await consumer.consume([1, 2])
+    await consumer.consume([1, 2])
+    await consumer.consume([3])
+
+    assert calls == 2
+    assert consumer.result == 3
+    assert cache.hits == 1 and cache.misses == 2
+
+@pytest.mark.asyncio
+async def test_consume_with_cache_runs_callback_for_unhashable_payload():
+    calls = 0
+
+    class Obj:
+        pass
+
+    def callback(payload):
+        nonlocal calls
+        calls += 1
+        return calls
+
+    consumer = Consumer(callback=callback, cache=ResultCache())
+    await consumer.consume([Obj()])
+    await consumer.consume([Obj()])
+
+    assert calls == 2
+    assert consumer.cache.skipped == 2
+
+@pytest.mark.asyncio
+async def test_shared_cache_keeps_consumer_results_apart():
+    cache = ResultCache()
+    consumer_a = Consumer("A", callback=lambda payload: f"A:{sum(payload)}", cache=cache)
+    consumer_b = Consumer("B", callback=lambda payload: f"B:{sum(payload)}", cache=cache)
+
+    await consumer_a.consume([1, 2])
+    await consumer_b.consume([1, 2])
+
+    assert consumer_a.result == "A:3"
+    assert consumer_b.result == "B:3"
+    assert len(cache) == 2
@@ -2,6 +2,8 @@ import pytest
 import asyncio
 from src.archi.emitter import Emitter, EmitterFactory
 from src.archi.broker import Broker
+from src.archi.consumer import Consumer
+from src.archi.coalesce import LIST
 from unittest.mock import AsyncMock, MagicMock
 
 pytestmark = pytest.mark.asyncio
@@ -126,3 +128,101 @@ async def test_resolve_sets_event_and_calls_callback():
 
     assert was_called is True
     assert emitter._resolved.is_set()
+
+# -------- Coalescing Tests --------
+
+@pytest.mark.asyncio
+async def test_repeated_emit_in_session_is_deduped_and_merged():
+    broker = Broker(timeout=0.3)
+    received = []
+    consumer = Consumer(callback=lambda payload: received.append(list(payload)))
+    broker.register_consumer(consumer)
+
+    starter = Emitter("STARTER")
+    chatty = Emitter("CHATTY", reducer=LIST)
+    broker.register_emitter(starter)
+    broker.register_emitter(chatty)
+
+    calls = 0
+    def resolve_callback():
+        nonlocal calls
+        calls += 1
+    chatty.resolve_callback = resolve_callback
+
+    task = asyncio.create_task(starter.emit("start"))
+    await asyncio.sleep(0.01)
+    await chatty.emit(1)
+    await chatty.emit(2)
+    await chatty.emit(3)
+    assert await task is True
+
+    assert calls == 1
+    assert chatty.coalesced == 2
+    assert received == [["start", [1, 2, 3]]]
+
+@pytest.mark.asyncio
+async def test_custom_reducer_merges_payloads():
+    broker = Broker(timeout=0.3)
+    received = []
+    broker.register_consumer(Consumer(callback=lambda payload: received.append(list(payload))))
+
+    starter = Emitter("STARTER")
+    counter = Emitter("COUNTER", reducer=lambda merged, payload: merged + payload)
+    broker.register_emitter(starter)
+    broker.register_emitter(counter)
+
+    task = asyncio.create_task(starter.emit("start"))
+    await asyncio.sleep(0.01)
+    for _ in range(4):
+        await counter.emit(1)
+    await task
+
+    assert received == [["start", 4]]
+    assert counter.coalesced == 3
+
+@pytest.mark.asyncio
+async def test_debounce_collapses_emits_into_one_session():
+    emitter = Emitter("DEBOUNCED", debounce=0.05)
+    broker = MagicMock()
+    broker._session_opened = False
+    broker._pending_sessions = 0
+    broker.collect_emit = AsyncMock(return_value=True)
+    emitter.broker = broker
+
+    results = await asyncio.gather(*[emitter.emit(i) for i in range(5)])
+
+    assert results == [True] * 5
+    broker.collect_emit.assert_awaited_once_with("DEBOUNCED", 4)
+    assert emitter.coalesced == 4
+
+@pytest.mark.asyncio
+async def test_debounce_with_real_broker_folds_payloads():
+    broker = Broker(timeout=0.3)
+    received = []
+    broker.register_consumer(Consumer(callback=lambda payload: received.append(list(payload))))
+    emitter = Emitter("DEBOUNCED", reducer=LIST, debounce=0.05)
+    broker.register_emitter(emitter)
+
+    results = await asyncio.gather(*[emitter.emit(i) for i in range(3)])
+
+    assert results == [True] * 3
+    assert received == [[[0, 1, 2]]]
+    assert emitter.coalesced == 2
+
+@pytest.mark.asyncio
+async def test_debounce_survives_cancelled_first_caller():
+    broker = Broker(timeout=0.3)
+    received = []
+    broker.register_consumer(Consumer(callback=lambda payload: received.append(list(payload))))
+    emitter = Emitter("DEBOUNCED", reducer=LIST, debounce=0.05)
+    broker.register_emitter(emitter)
+
+    first = asyncio.create_task(emitter.emit("a"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(emitter.emit("b"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second is True
+    assert first.cancelled()
+    assert received == [[["a", "b"]]]
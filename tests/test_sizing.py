@@ -0,0 +1,16 @@
+from src.archi.sizing import deep_sizeof
+
+def test_deep_sizeof_follows_containers():
+    assert deep_sizeof({"blob": "x" * 10_000}) > 10_000
+    assert deep_sizeof([["x" * 10_000]]) > 10_000
+
+def test_deep_sizeof_follows_instance_attributes():
+    class Result:
+        def __init__(self):
+            self.data = "x" * 10_000
+
+    assert deep_sizeof(Result()) > 10_000
+
+def test_deep_sizeof_counts_shared_objects_once():
+    blob = "x" * 10_000
+    assert deep_sizeof([blob, blob]) < 2 * 10_000